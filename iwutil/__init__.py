@@ -1,7 +1,6 @@
 from . import save
-import matplotlib.pyplot as plt
 import numpy as np
-from functools import singledispatch
+from functools import singledispatch, partial
 import pandas as pd
 from pathlib import Path
 import shutil
@@ -15,6 +14,9 @@ def subplots_autolayout(
     """
     Create a subplot element with a
     """
+    # Imported here so that importing iwutil does not pay matplotlib's start-up cost
+    import matplotlib.pyplot as plt
+
     n_rows = n_rows or int(n // np.sqrt(n))
     n_cols = int(np.ceil(n / n_rows))
 
@@ -140,19 +142,24 @@ def _(file: pd.DataFrame, **kwargs):
     return file
 
 
+# Reader for each supported file extension
+_DF_READERS = {
+    "csv": pd.read_csv,
+    "xls": pd.read_excel,
+    "xlsx": pd.read_excel,
+    # pandas' default float parser is not round-trip exact
+    "json": partial(pd.read_json, precise_float=True),
+    "parquet": pd.read_parquet,
+}
+
+
 def iwutil_file_path_helper(file_name: str | Path, **kwargs):
     file_extension = Path(file_name).suffix[1:]
 
-    if file_extension == "csv":
-        return pd.read_csv(file_name, **kwargs)
-    elif file_extension in ["xls", "xlsx"]:
-        return pd.read_excel(file_name, **kwargs)
-    elif file_extension == "json":
-        return pd.read_json(file_name, **kwargs)
-    elif file_extension == "parquet":
-        return pd.read_parquet(file_name, **kwargs)
-    else:
+    reader = _DF_READERS.get(file_extension)
+    if reader is None:
         raise ValueError(f"Unsupported file type: {file_extension}")
+    return reader(file_name, **kwargs)
 
 def read_json(file_name):
     """
@@ -1,5 +1,9 @@
+import os
 from pathlib import Path
-from json import dump
+from json import dumps
+from csv import writer
+from collections.abc import Mapping, Set
+import pandas as pd
 
 
 def create_folder(filename):
@@ -20,14 +24,31 @@ def json(params, filename):
 
     Parameters
     ----------
-    params : dict
-        Dictionary of parameters
+    params : dict or pandas.DataFrame
+        Dictionary of parameters. A DataFrame is written in the same format as
+        df.to_dict(orient="list"), which can be read back with read_df. Datetimes
+        are written as ISO 8601 strings and missing values (NaT, pd.NA) as null
     filename : str
         Full path and name of the file to save
     """
+    if isinstance(params, pd.DataFrame):
+        params = params.to_dict(orient="list")
+    # Serialise before opening the file so that a failure leaves no partial file
+    content = dumps(params, indent=2, default=_json_default)
     create_folder(filename)
     with open(filename, "w") as f:
-        dump(params, f, indent=2)
+        f.write(content)
+
+
+def _json_default(obj):
+    """
+    Convert objects that the json module cannot serialise natively
+    """
+    if obj is pd.NaT or obj is pd.NA:
+        return None
+    if hasattr(obj, "isoformat"):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def csv(df, filename):
@@ -36,13 +57,50 @@ def csv(df, filename):
 
     Parameters
     ----------
-    df : pandas.DataFrame
-        DataFrame to save
+    df : pandas.DataFrame or dict
+        DataFrame to save. A dict of equal-length columns is written directly with
+        the standard library csv writer, without building a DataFrame. As with
+        DataFrame.to_csv, missing values (None or NaN) are written as empty fields
     filename : str
         Full path and name of the file to save
+
+    Raises
+    ------
+    ValueError
+        If df is a dict whose values are not list-like or not all the same length
     """
+    if isinstance(df, dict):
+        _csv_from_dict(df, filename)
+    else:
+        create_folder(filename)
+        df.to_csv(filename, index=False)
+
+
+def _csv_from_dict(data, filename):
+    """
+    Save a dict of equal-length columns to a csv file in the same format as
+    DataFrame.to_csv(index=False). Nothing is written if the columns are invalid
+    """
+    for column in data.values():
+        if isinstance(column, (str, Mapping, Set)) or not hasattr(column, "__len__"):
+            raise ValueError("All dict values must be list-like columns")
+    if len({len(column) for column in data.values()}) > 1:
+        raise ValueError("All columns must be the same length")
+
+    # Missing values (None, NaN, NaT, pd.NA) are written as empty fields
+    rows = [
+        [
+            "" if pd.api.types.is_scalar(value) and pd.isna(value) else value
+            for value in row
+        ]
+        for row in zip(*data.values())
+    ]
+
     create_folder(filename)
-    df.to_csv(filename, index=False)
+    with open(filename, "w", newline="") as f:
+        csv_writer = writer(f, lineterminator=os.linesep)
+        csv_writer.writerow(data.keys())
+        csv_writer.writerows(rows)
 
 
 def parquet(df, filename):
@@ -57,7 +115,7 @@ def parquet(df, filename):
         Full path and name of the file to save
     """
     create_folder(filename)
-    df.to_parquet(filename)
+    df.to_parquet(filename, compression="zstd")
 
 
 def fig(fig_to_save, filename):
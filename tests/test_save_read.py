@@ -1,55 +1,116 @@
 import iwutil
 import pandas as pd
-import tempfile
 import pytest
-import pathlib
+
+
+@pytest.fixture(scope="module")
+def tmpdir_module(tmp_path_factory):
+    return tmp_path_factory.mktemp("save_read")
+
+
+@pytest.fixture
+def tmp_stem(tmpdir_module, request):
+    # Unique per test case, so files never collide in the shared directory
+    return tmpdir_module / request.node.name
 
 
 @pytest.mark.parametrize("file_format", ["df", "csv", "parquet", "json", "csv"])
 @pytest.mark.parametrize("path_format", ["posix path", "str"])
-def test_save_read_df(file_format, path_format):
+def test_save_read_df(file_format, path_format, tmp_stem):
     df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
 
     df_read = pd.DataFrame()
     if file_format == "df":
         df_read = iwutil.read_df(df)
     else:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            name = "test." + file_format
-
-            if path_format == "posix path":
-                temp_dir = pathlib.Path(temp_dir)
-                file = temp_dir / name
-            else:
-                file = temp_dir + "/" + name
-
-            if file_format == "csv":
-                iwutil.save.csv(df, file)
-            elif file_format == "parquet":
-                iwutil.save.parquet(df, file)
-            elif file_format == "json":
-                iwutil.save.json(df.to_dict(orient="list"), file)
-            else:
-                raise NotImplementedError(f"Test does not cover format: {file_format}")
-
-            df_read = iwutil.read_df(file)
+        file = tmp_stem.with_suffix(f".{file_format}")
+        if path_format == "str":
+            file = str(file)
+
+        if file_format == "csv":
+            iwutil.save.csv(df, file)
+        elif file_format == "parquet":
+            iwutil.save.parquet(df, file)
+        elif file_format == "json":
+            iwutil.save.json(df.to_dict(orient="list"), file)
+        else:
+            raise NotImplementedError(f"Test does not cover format: {file_format}")
+
+        df_read = iwutil.read_df(file)
     assert df.equals(df_read)
 
 
-def test_read_df_kwargs():
+def test_read_df_kwargs(tmp_stem):
     df = pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]})
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file = temp_dir + "/test.csv"
-        iwutil.save.csv(df, file)
+    file = tmp_stem.with_suffix(".csv")
+    iwutil.save.csv(df, file)
 
-        df_read = iwutil.read_df(file, usecols=["a"])
-        assert df_read.equals(pd.DataFrame({"a": [1, 2, 3]}))
+    df_read = iwutil.read_df(file, usecols=["a"])
+    assert df_read.equals(pd.DataFrame({"a": [1, 2, 3]}))
 
 
-def test_read_json():
+def test_read_json(tmp_stem):
     data = {"a": 1, "b": 4}
-    with tempfile.TemporaryDirectory() as temp_dir:
-        file = temp_dir + "/test.json"
-        iwutil.save.json(data, file)
-        assert iwutil.read_json(file) == data
+    file = tmp_stem.with_suffix(".json")
+    iwutil.save.json(data, file)
+    assert iwutil.read_json(file) == data
+
+
+def test_save_csv_dict(tmp_stem):
+    data = {
+        "a": [1, 2, 3],
+        "b": [4.5, float("nan"), 6.5],
+        "c": ["x", None, "z"],
+        "d": pd.array([1, None, 3], dtype="Int64"),
+        "e": pd.Series(["x", None, "z"], dtype="string"),
+    }
+    dict_file = tmp_stem.with_suffix(".dict.csv")
+    df_file = tmp_stem.with_suffix(".df.csv")
+    iwutil.save.csv(data, dict_file)
+    iwutil.save.csv(pd.DataFrame(data), df_file)
+
+    with open(dict_file) as f1, open(df_file) as f2:
+        assert f1.read() == f2.read()
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ({"a": [1, 2, 3], "b": [1]}, "same length"),
+        ({"a": 1}, "list-like"),
+        ({"a": "abc"}, "list-like"),
+        ({"a": {"x": 1, "y": 2}}, "list-like"),
+        ({"a": {1, 2}}, "list-like"),
+    ],
+)
+def test_save_csv_dict_invalid(data, message, tmp_stem):
+    file = tmp_stem.with_suffix(".csv")
+    with pytest.raises(ValueError, match=message):
+        iwutil.save.csv(data, file)
+    assert not file.exists()
+
+
+def test_read_df_unsupported_extension():
+    with pytest.raises(ValueError, match="Unsupported file type: txt"):
+        iwutil.read_df("data.txt")
+
+
+def test_save_json_df(tmp_stem):
+    df = pd.DataFrame(
+        {
+            "a": [1, 2, 3],
+            "b": [4.5, 1 / 3, 1.2345678901234567e-10],
+            "date": pd.to_datetime(["2024-01-01 00:00", "2024-01-02 12:30", None]),
+        }
+    )
+    file = tmp_stem.with_suffix(".json")
+    iwutil.save.json(df, file)
+    assert df.equals(iwutil.read_df(file))
+
+
+def test_save_json_unserializable(tmp_stem):
+    file = tmp_stem.with_suffix(".json")
+    with pytest.raises(TypeError, match="not JSON serializable"):
+        iwutil.save.json({"a": object()}, file)
+    assert not file.exists()